@@ -79,34 +79,20 @@ height = 1
 ###############################################################################
 # In order to see how cylinders are made, we set different resolutions (number
 # of sides used to define the bases of the cylinder) to see how it changes the
-# surface of the primitive.
+# surface of the primitive. Passing one resolution per center builds all the
+# cylinders into a single actor, so they are drawn with one call instead of one
+# per resolution.
 
-cylinders_8 = fury.actor.cylinder(
-    centers[:3],
-    dirs[:3],
-    colors[:3],
-    radius=radius,
-    heights=height,
-    capped=True,
-    resolution=8,
-)
-cylinders_16 = fury.actor.cylinder(
-    centers[3:6],
-    dirs[3:6],
-    colors[3:6],
-    radius=radius,
-    heights=height,
-    capped=True,
-    resolution=16,
-)
-cylinders_32 = fury.actor.cylinder(
-    centers[6:9],
-    dirs[6:9],
-    colors[6:9],
+resolutions = np.repeat([8, 16, 32], 3)
+
+cylinders = fury.actor.cylinder(
+    centers,
+    dirs,
+    colors,
     radius=radius,
     heights=height,
     capped=True,
-    resolution=32,
+    resolution=resolutions,
 )
 
 ###############################################################################
@@ -114,28 +100,31 @@ cylinders_32 = fury.actor.cylinder(
 
 scene = fury.window.Scene()
 
-scene.add(cylinders_8)
-scene.add(cylinders_16)
-scene.add(cylinders_32)
+scene.add(cylinders)
 
 interactive = False
 
 if interactive:
     fury.window.show(scene)
 
-fury.window.record(scene=scene, size=(600, 600), out_path="viz_poly_cylinder.png")
+###############################################################################
+# We save the images through a show manager, which keeps a single render
+# window for all of them, so the actors are not uploaded to the GPU again each
+# time an image is saved.
+
+show_manager = fury.window.ShowManager(scene=scene, size=(600, 600))
+
+show_manager.record(out_path="viz_poly_cylinder.png")
 
 ###############################################################################
 # Visualize the surface geometry representation for the object.
 
-cylinders_8.GetProperty().SetRepresentationToWireframe()
-cylinders_16.GetProperty().SetRepresentationToWireframe()
-cylinders_32.GetProperty().SetRepresentationToWireframe()
+cylinders.GetProperty().SetRepresentationToWireframe()
 
 if interactive:
     fury.window.show(scene)
 
-fury.window.record(scene=scene, size=(600, 600), out_path="viz_poly_cylinder_geom.png")
+show_manager.record(out_path="viz_poly_cylinder_geom.png")
 
 ###############################################################################
 # Then we clean the scene to render the boxes we will use to render our
@@ -175,43 +164,72 @@ box_actor = fury.actor.box(
 #
 # We need to associate the data to each of the 8 vertices that make up the box
 # since we handle the processing of individual vertices in the vertex shader.
+#
+# Instead of uploading one array per property, we pack them into two float32
+# arrays of 4 components, the largest size of a vertex attribute: the center
+# with the radius, and the direction with the height. Directions are normalized
+# here, once, so the shaders can use them as they are.
 
-rep_directions = np.repeat(dirs, 8, axis=0)
-rep_centers = np.repeat(centers, 8, axis=0)
-rep_radii = np.repeat(np.repeat(radius, 9), 8, axis=0)
-rep_heights = np.repeat(np.repeat(height, 9), 8, axis=0)
+nb_vertices = 8 * len(centers)
 
-fury.shaders.attribute_to_actor(box_actor, rep_centers, "center")
-fury.shaders.attribute_to_actor(box_actor, rep_directions, "direction")
-fury.shaders.attribute_to_actor(box_actor, rep_radii, "radius")
-fury.shaders.attribute_to_actor(box_actor, rep_heights, "height")
+centers_radii = np.empty((nb_vertices, 4), dtype=np.float32)
+centers_radii[:, :3] = np.repeat(centers, 8, axis=0)
+centers_radii[:, 3] = radius
+
+directions_heights = np.empty((nb_vertices, 4), dtype=np.float32)
+directions_heights[:, :3] = np.repeat(
+    dirs / np.linalg.norm(dirs, axis=1, keepdims=True), 8, axis=0
+)
+directions_heights[:, 3] = height
+
+fury.shaders.attribute_to_actor(box_actor, centers_radii, "centerRadius")
+fury.shaders.attribute_to_actor(box_actor, directions_heights, "directionHeight")
 
 ###############################################################################
 # Then we have the shader code implementation corresponding to vertex and
 # fragment shader. Here we are passing data to the fragment shader through
 # the vertex shader.
 #
-# Vertex shaders perform basic processing of each individual vertex.
+# We use this function to generate an appropriate rotation matrix which help us
+# to transform our position vectors in order to align the direction of
+# cylinder with respect to the box.
+
+vec_to_vec_rot_mat = fury.shaders.import_fury_shader(
+    os.path.join("utils", "vec_to_vec_rot_mat.glsl")
+)
+
+###############################################################################
+# Vertex shaders perform basic processing of each individual vertex. The
+# orientation of a cylinder is the same for all the vertices of its box, so we
+# build its rotation matrix here, once per vertex, instead of rebuilding it in
+# the fragment shader at every ray marching step. The same goes for the camera
+# position, which is the origin of every ray. VTK already declares the
+# MCVCMatrix uniform in the vertex shader.
 
-vs_dec = """
-    in vec3 center;
-    in vec3 direction;
-    in float height;
-    in float radius;
+vs_vars_dec = """
+    in vec4 centerRadius;
+    in vec4 directionHeight;
 
     out vec4 vertexMCVSOutput;
     out vec3 centerMCVSOutput;
-    out vec3 directionVSOutput;
+    out vec4 roVSOutput;
+    out mat4 rotationMatrixVSOutput;
     out float heightVSOutput;
     out float radiusVSOutput;
     """
 
+vs_dec = fury.shaders.compose_shader([vs_vars_dec, vec_to_vec_rot_mat])
+
 vs_impl = """
     vertexMCVSOutput = vertexMC;
-    centerMCVSOutput = center;
-    directionVSOutput = direction;
-    heightVSOutput = height;
-    radiusVSOutput = radius;
+    centerMCVSOutput = centerRadius.xyz;
+    roVSOutput = -MCVCMatrix[3] * MCVCMatrix;  // camera position in world space
+    // the sdCylinder function creates vertical cylinders by default, that
+    // is the cylinder is created pointing in the up direction (0, 1, 0).
+    // We want to rotate that vector to be aligned with the box's direction
+    rotationMatrixVSOutput = vec2VecRotMat(directionHeight.xyz, vec3(0, 1, 0));
+    heightVSOutput = directionHeight.w;
+    radiusVSOutput = centerRadius.w;
     """
 
 ###############################################################################
@@ -234,22 +252,12 @@ fury.shaders.shader_to_actor(box_actor, "vertex", decl_code=vs_dec, impl_code=vs
 fs_vars_dec = """
     in vec4 vertexMCVSOutput;
     in vec3 centerMCVSOutput;
-    in vec3 directionVSOutput;
+    in vec4 roVSOutput;
+    in mat4 rotationMatrixVSOutput;
     in float heightVSOutput;
     in float radiusVSOutput;
-
-    uniform mat4 MCVCMatrix;
     """
 
-###############################################################################
-# We use this function to generate an appropriate rotation matrix which help us
-# to transform our position vectors in order to align the direction of
-# cylinder with respect to the box.
-
-vec_to_vec_rot_mat = fury.shaders.import_fury_shader(
-    os.path.join("utils", "vec_to_vec_rot_mat.glsl")
-)
-
 ###############################################################################
 # We calculate the distance using the SDF function for the cylinder.
 
@@ -261,13 +269,10 @@ sd_cylinder = fury.shaders.import_fury_shader(os.path.join("sdf", "sd_cylinder.f
 sdf_map = """
     float map(in vec3 position)
     {
-        // the sdCylinder function creates vertical cylinders by default, that
-        // is the cylinder is created pointing in the up direction (0, 1, 0).
-        // We want to rotate that vector to be aligned with the box's direction
-        mat4 rot = vec2VecRotMat(normalize(directionVSOutput),
-                                 normalize(vec3(0, 1, 0)));
-
-        vec3 pos = (rot * vec4(position - centerMCVSOutput, 0.0)).xyz;
+        // align the position with the vertical cylinder using the rotation
+        // matrix computed in the vertex shader
+        vec3 pos = (rotationMatrixVSOutput *
+                    vec4(position - centerMCVSOutput, 0.0)).xyz;
 
         // distance to the cylinder's boundary
         return sdCylinder(pos, radiusVSOutput, heightVSOutput / 2);
@@ -275,25 +280,110 @@ sdf_map = """
     """
 
 ###############################################################################
-# We use central differences technique for computing surface normals.
+# The surface normals of a cylinder have a closed form: they point along its
+# axis on the caps, and away from its axis on the side. Computing them
+# directly is much cheaper than estimating the gradient of the SDF, which
+# takes 6 extra evaluations of the map function.
+
+cylinder_normal = """
+    vec3 cylinderNormal(in vec3 position)
+    {
+        // position in the frame of the vertical cylinder
+        vec3 pos = (rotationMatrixVSOutput *
+                    vec4(position - centerMCVSOutput, 0.0)).xyz;
+
+        // pick the closest of the caps and the side
+        vec3 normal;
+        if(abs(abs(pos.y) - heightVSOutput / 2) <
+           abs(length(pos.xz) - radiusVSOutput))
+            normal = vec3(0, sign(pos.y), 0);
+        else
+            normal = normalize(vec3(pos.x, 0, pos.z));
+
+        // rotate the normal back, the inverse of a rotation is its transpose
+        return normalize(transpose(mat3(rotationMatrixVSOutput)) * normal);
+    }
+    """
+
+###############################################################################
+# The central differences technique gives the normals of any SDF. We keep it
+# to check the analytic normals, by defining DEBUG_NORMALS in the shader.
 
 central_diffs_normal = fury.shaders.import_fury_shader(
     os.path.join("sdf", "central_diffs.frag")
 )
 
 ###############################################################################
-# We use cast_ray for the implementation of Ray Marching.
-
-cast_ray = fury.shaders.import_fury_shader(
-    os.path.join("ray_marching", "cast_ray.frag")
-)
+# For the implementation of Ray Marching we use sphere tracing: at each step
+# the ray advances by the distance to the surface. Since the rays start on the
+# faces of the box, they either hit the cylinder or leave the box after a few
+# dozen steps, so the loop can be tightly bounded. The hit tolerance grows
+# with the distance travelled, which lets far away rays stop earlier.
+
+cast_ray = """
+    float castRay(in vec3 ro, vec3 rd)
+    {
+        float t = 0.0;
+        for(int i=0; i < 96; i++)
+        {
+            float h = map(ro + t * rd);
+            t += h;
+            // also stops if the ray ends up inside the cylinder (h < 0)
+            if(h < 0.001 * max(t, 1.0) || t > 20.0)
+                break;
+        }
+        return t;
+    }
+    """
 
 ###############################################################################
-# For the illumination of the scene we use the Blinn-Phong model.
+# For the illumination of the scene we use the Blinn-Phong model. Its specular
+# factor raises the diffuse factor to the specular power of the actor. Rather
+# than evaluating ``pow`` for every fragment, we specialize the shared lighting
+# snippet with the GLSL code of the actor's current power: an integer power is
+# computed with a few multiplications by repeated squaring. The generated code
+# falls back to ``pow`` when the specular power is changed afterwards. With the
+# default specular power of 1 and specular coefficient of 0 used here, the
+# generated factor is just ``df``, so this example shows the technique rather
+# than a measurable speedup.
+
+
+def specular_factor_code(power):
+    """Return GLSL statements and expression computing ``df`` ** ``sp``."""
+    if power != int(power) or power < 0:
+        return [], "pow(df, sp)"
+    power = int(power)
+
+    statements = []
+    factors = []
+    square = "df"
+    exponent = 1
+    while exponent <= power:
+        if power & exponent:
+            factors.append(square)
+        exponent *= 2
+        if exponent <= power:
+            statements.append(f"float df{exponent} = {square} * {square};")
+            square = f"df{exponent}"
+    exact = " * ".join(factors) or "1.0"
+    return statements, f"sp == {float(power)} ? {exact} : pow(df, sp)"
+
+
+specular_statements, specular_factor = specular_factor_code(
+    box_actor.GetProperty().GetSpecularPower()
+)
 
 blinn_phong_model = fury.shaders.import_fury_shader(
     os.path.join("lighting", "blinn_phong_model.frag")
 )
+specular_line = "float sf = pow(df, sp);"
+if specular_line not in blinn_phong_model:
+    raise ValueError(f"{specular_line!r} not found in the Blinn-Phong model")
+blinn_phong_model = blinn_phong_model.replace(
+    specular_line,
+    "".join(f"{statement}\n    " for statement in specular_statements)
+    + f"float sf = {specular_factor};",
+)
 
 ###############################################################################
 # Now we use compose_shader to join our pieces of GLSL shader code.
@@ -301,9 +391,9 @@ blinn_phong_model = fury.shaders.import_fury_shader(
 fs_dec = fury.shaders.compose_shader(
     [
         fs_vars_dec,
-        vec_to_vec_rot_mat,
         sd_cylinder,
         sdf_map,
+        cylinder_normal,
         central_diffs_normal,
         cast_ray,
         blinn_phong_model,
@@ -320,7 +410,7 @@ sdf_cylinder_frag_impl = """
     vec3 point = vertexMCVSOutput.xyz;
 
     // ray origin
-    vec4 ro = -MCVCMatrix[3] * MCVCMatrix;  // camera position in world space
+    vec4 ro = roVSOutput;
 
     // ray direction
     vec3 rd = normalize(point - ro.xyz);
@@ -335,7 +425,11 @@ sdf_cylinder_frag_impl = """
     if(t < 20.0)
     {
         vec3 position = ro.xyz + t * rd;
+        #ifdef DEBUG_NORMALS
         vec3 normal = centralDiffsNormals(position, .0001);
+        #else
+        vec3 normal = cylinderNormal(position);
+        #endif
         float lightAttenuation = dot(ld, normal);
         vec3 color = blinnPhongIllumModel(
                         lightAttenuation, lightColor0, diffuseColor,
@@ -356,11 +450,12 @@ fury.shaders.shader_to_actor(
 # Finally, we visualize the cylinders made using ray marching and SDFs.
 
 scene.add(box_actor)
+scene.reset_camera()
 
 if interactive:
     fury.window.show(scene)
 
-fury.window.record(scene=scene, size=(600, 600), out_path="viz_sdf_cylinder.png")
+show_manager.record(out_path="viz_sdf_cylinder.png")
 
 ###############################################################################
 # References
@@ -34,6 +34,13 @@ ring = fury.ui.Disk2D(
     outer_radius=50, inner_radius=45, center=(500, 300), color=(0, 1, 1)
 )
 
+###############################################################################
+# Every UI element is rendered with its own draw call. Static shapes that are
+# always shown together can be merged into a single actor with a batch, so
+# both disks are drawn at once.
+
+disks = fury.ui.UIBatch([disk, ring])
+
 ###############################################################################
 # Image
 # =====
@@ -92,12 +99,14 @@ panel.add_element(button_example, (0.25, 0.33))
 panel.add_element(second_button_example, (0.66, 0.33))
 
 ###############################################################################
-# We can add a callback to each button to perform some action.
+# We can add a callback to each button to perform some action. The text only
+# changes on the first click, so the scene is only rendered again then.
 
 
 def change_text_callback(i_ren, _obj, _button):
-    text.message = "Clicked!"
-    i_ren.force_render()
+    if text.message != "Clicked!":
+        text.message = "Clicked!"
+        i_ren.force_render()
 
 
 def change_icon_callback(i_ren, _obj, _button):
@@ -122,6 +131,13 @@ cube = fury.actor.cube(
     directions=np.array([[0, 0, 1]]),
 )
 
+###############################################################################
+# The geometry of the cube never changes, only its transform and visibility
+# do. Marking its mapper as static lets VTK skip the pipeline update checks
+# every time the scene is rendered.
+
+cube.GetMapper().SetStatic(True)
+
 ###############################################################################
 # Now we'll add three sliders: one circular and two linear.
 
@@ -160,22 +176,20 @@ ring_slider.on_change = rotate_cube
 
 ###############################################################################
 # Similarly, we can translate the cube with line sliders.
-# We use global variables to keep track of the position of the cube.
+# We use an array to keep track of the position of the cube, each slider
+# updates its own coordinate in place.
 
-cube_x = 0
-cube_y = 0
+cube_position = np.zeros(3)
 
 
 def translate_cube_x(slider):
-    global cube_x, cube_y
-    cube_x = slider.value
-    cube.SetPosition(cube_x, cube_y, 0)
+    cube_position[0] = slider.value
+    cube.SetPosition(cube_position)
 
 
 def translate_cube_y(slider):
-    global cube_x, cube_y
-    cube_y = slider.value
-    cube.SetPosition(cube_x, cube_y, 0)
+    cube_position[1] = slider.value
+    cube.SetPosition(cube_position)
 
 
 line_slider_x.on_change = translate_cube_x
@@ -223,16 +237,16 @@ range_slider_y = fury.ui.RangeSlider(
 # We just added many examples. If we showed them all at once, they would fill
 # the screen. Let's make a simple menu to choose which example is shown.
 #
-# We'll first make a list of the examples.
-
-examples = [
-    [rect],
-    [disk, ring],
-    [img],
-    [panel],
-    [ring_slider, line_slider_x, line_slider_y],
-    [range_slider_x, range_slider_y],
-]
+# We'll first make a tuple of the examples, since it will not change.
+
+examples = (
+    (rect,),
+    (disks,),
+    (img,),
+    (panel,),
+    (ring_slider, line_slider_x, line_slider_y),
+    (range_slider_x, range_slider_y),
+)
 
 ###############################################################################
 # Now we'll make a function to hide all the examples. Then we'll call it so
@@ -249,17 +263,17 @@ def hide_all_examples():
 hide_all_examples()
 
 ###############################################################################
-# To make the menu, we'll first need to create a list of labels which
-# correspond with the examples.
+# To make the menu, we'll first need to create the labels which correspond
+# with the examples.
 
-values = [
+values = (
     "Rectangle",
     "Disks",
     "Image",
     "Button Panel",
     "Line & Ring Slider",
     "Range Slider",
-]
+)
 
 ###############################################################################
 # Now we can create the menu.
@@ -270,16 +284,25 @@ listbox = fury.ui.ListBox2D(
 
 ###############################################################################
 # Then we will use a callback to show the correct example when a label is
-# clicked.
+# clicked. We map each label to the index of its example, build the set of
+# elements of each example once, and keep track of the elements currently
+# shown, so that only the elements whose visibility changes are updated.
+
+value_to_idx = {value: idx for idx, value in enumerate(values)}
+example_sets = tuple(frozenset(example) for example in examples)
+shown_elements = set()
 
 
 def display_element():
-    hide_all_examples()
-    example = examples[values.index(listbox.selected[0])]
-    for element in example:
+    idx = value_to_idx[listbox.selected[0]]
+    new_elements = example_sets[idx]
+    for element in shown_elements - new_elements:
+        element.set_visibility(False)
+    for element in new_elements - shown_elements:
         element.set_visibility(True)
-    if values.index(listbox.selected[0]) == 4:
-        cube.SetVisibility(True)
+    shown_elements.clear()
+    shown_elements.update(new_elements)
+    cube.SetVisibility(idx == 4)
 
 
 listbox.on_change = display_element
@@ -294,11 +317,9 @@ listbox.on_change = display_element
 current_size = (800, 800)
 show_manager = fury.window.ShowManager(size=current_size, title="FURY UI Example")
 
-show_manager.scene.add(listbox)
-for example in examples:
-    for element in example:
-        show_manager.scene.add(element)
-show_manager.scene.add(cube)
+show_manager.scene.add(
+    listbox, *(element for example in examples for element in example), cube
+)
 show_manager.scene.reset_camera()
 show_manager.scene.set_camera(position=(0, 0, 200))
 show_manager.scene.reset_clipping_range()
@@ -310,6 +331,4 @@ interactive = False
 if interactive:
     show_manager.start()
 
-fury.window.record(
-    scene=show_manager.scene, size=current_size, out_path="viz_fury.ui.png"
-)
+show_manager.record(out_path="viz_fury.ui.png")
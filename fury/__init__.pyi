@@ -387,6 +387,7 @@ from .ui import (
     TabUI as TabUI,
     TextBlock2D as TextBlock2D,
     TextBox2D as TextBox2D,
+    UIBatch as UIBatch,
     cal_bounding_box_2d as cal_bounding_box_2d,
     check_overflow as check_overflow,
     clip_overflow as clip_overflow,
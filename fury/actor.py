@@ -1905,6 +1905,85 @@ def sphere(
     return sphere_actor
 
 
+def _repeat_cylinders_by_resolution(
+    centers, directions, colors, *, radius, heights, capped, resolution
+):
+    """Repeat cylinder primitives with a different resolution per center.
+
+    Cylinders sharing a resolution are repeated together, then the meshes are
+    concatenated in the order of ``centers``, so they can be rendered by a
+    single actor. The primitives do not all have the same number of vertices.
+
+    Parameters
+    ----------
+    centers : ndarray, shape (N, 3)
+        Cylinder positions.
+    directions : ndarray, shape (N, 3)
+        The orientation vector of the cylinder.
+    colors : ndarray (N,3) or (N, 4) or tuple (3,) or tuple (4,)
+        RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1].
+    radius : float
+        cylinder radius.
+    heights : ndarray, shape (N) or float
+        The height of the cylinder.
+    capped : bool
+        Turn on/off whether to cap cylinder with polygons.
+    resolution : ndarray, shape (N)
+        Number of facets/sectors used to define each cylinder.
+
+    Returns
+    -------
+    big_verts : ndarray
+    big_faces : ndarray
+    big_colors : ndarray
+
+    """
+    centers = np.asarray(centers)
+
+    def select(arr, idx, *, ndim):
+        # Per-center arrays are split between groups, shared values are kept
+        arr = np.asarray(arr)
+        if arr.ndim == ndim and len(arr) == len(centers):
+            return arr[idx]
+        return arr
+
+    # Vertices, local faces and colors of each cylinder, in centers order
+    prims = [None] * len(centers)
+    for sectors in np.unique(resolution):
+        idx = np.flatnonzero(resolution == sectors)
+        verts, faces = fp.prim_cylinder(
+            radius=radius, sectors=int(sectors), capped=capped
+        )
+        res = fp.repeat_primitive(
+            verts,
+            faces,
+            centers=centers[idx],
+            directions=select(directions, idx, ndim=2),
+            colors=select(colors, idx, ndim=2),
+            scales=select(heights, idx, ndim=1),
+        )
+        group_verts, group_faces, group_colors, _ = res
+        nb_verts = len(verts)
+        group_verts = group_verts.reshape((len(idx), nb_verts, 3))
+        group_colors = group_colors.reshape((len(idx), nb_verts, -1))
+        group_faces = group_faces.reshape((len(idx), len(faces), 3))
+        for k, center_idx in enumerate(idx):
+            prims[center_idx] = (
+                group_verts[k],
+                group_faces[k] - k * nb_verts,
+                group_colors[k],
+            )
+
+    offsets = np.cumsum([0] + [len(prim_verts) for prim_verts, _, _ in prims])
+    return (
+        np.concatenate([prim_verts for prim_verts, _, _ in prims]),
+        np.concatenate(
+            [prim_faces + offset for (_, prim_faces, _), offset in zip(prims, offsets)]
+        ),
+        np.concatenate([prim_colors for _, _, prim_colors in prims]),
+    )
+
+
 @warn_on_args_to_kwargs()
 def cylinder(
     centers,
@@ -1935,8 +2014,12 @@ def cylinder(
         The height of the cylinder.
     capped : bool
         Turn on/off whether to cap cylinder with polygons. Default (False).
-    resolution: int
-        Number of facets/sectors used to define cylinder.
+    resolution: int or ndarray, shape (N)
+        Number of facets/sectors used to define cylinder. An array gives the
+        resolution of each cylinder; cylinders are then merged into the same
+        actor in the order of ``centers``, so they do not all have the same
+        number of vertices. Arrays are only supported when
+        ``repeat_primitive`` is True.
     vertices : ndarray, shape (N, 3)
         The point cloud defining the sphere.
     faces : ndarray, shape (M, 3)
@@ -1964,32 +2047,55 @@ def cylinder(
     >>> # window.show(scene)
 
     """
+    if np.ndim(resolution) and np.size(resolution) == 1:
+        resolution = int(np.ravel(resolution)[0])
+
     if repeat_primitive:
-        if resolution < 8:
+        if np.any(np.asarray(resolution) < 8):
             # Sectors parameter should be greater than 7 in fp.prim_cylinder()
             raise ValueError("resolution parameter should be greater than 7")
+        if np.ndim(resolution) and np.shape(resolution) != (len(centers),):
+            raise ValueError(
+                "resolution size should be 1 or equal to the numbers of centers"
+            )
 
-        verts, faces = fp.prim_cylinder(
-            radius=radius,
-            sectors=resolution,
-            capped=capped,
-        )
-        res = fp.repeat_primitive(
-            verts,
-            faces,
-            centers=centers,
-            directions=directions,
-            colors=colors,
-            scales=heights,
-        )
+        if np.ndim(resolution) == 0:
+            verts, faces = fp.prim_cylinder(
+                radius=radius,
+                sectors=resolution,
+                capped=capped,
+            )
+            res = fp.repeat_primitive(
+                verts,
+                faces,
+                centers=centers,
+                directions=directions,
+                colors=colors,
+                scales=heights,
+            )
+            big_verts, big_faces, big_colors, _ = res
+        else:
+            big_verts, big_faces, big_colors = _repeat_cylinders_by_resolution(
+                centers,
+                directions,
+                colors,
+                radius=radius,
+                heights=heights,
+                capped=capped,
+                resolution=resolution,
+            )
 
-        big_verts, big_faces, big_colors, _ = res
         prim_count = len(centers)
         cylinder_actor = get_actor_from_primitive(
             big_verts, big_faces, colors=big_colors, prim_count=prim_count
         )
 
     else:
+        if np.ndim(resolution):
+            raise ValueError(
+                "One resolution per cylinder is only supported with "
+                "repeat_primitive=True"
+            )
         if faces is None:
             src = CylinderSource()
             src.SetCapping(capped)
@@ -202,34 +202,31 @@ def repeat_primitive(
 
     # update orientations
     directions = normalize_input(directions, arr_name="directions")
-    for pts, dirs in enumerate(directions):
-        # Normal vector of the object.
-        dir_abs = np.linalg.norm(dirs)
-        if dir_abs:
-            normal = np.array([1.0, 0.0, 0.0])
-            dirs = dirs / dir_abs
-            v = np.cross(normal, dirs)
-            c = np.dot(normal, dirs)
-
-            v1, v2, v3 = v
-
-            Vmat = np.array([[0, -v3, v2], [v3, 0, -v1], [-v2, v1, 0]])
-
-            if c == -1.0:
-                rotation_matrix = -np.eye(3, dtype=np.float64)
-            else:
-                h = 1 / (1 + c)
-                rotation_matrix = (
-                    np.eye(3, dtype=np.float64) + Vmat + (Vmat.dot(Vmat) * h)
-                )
-
-        else:
-            rotation_matrix = np.identity(3)
-
-        big_vertices[pts * unit_verts_size : (pts + 1) * unit_verts_size] = np.dot(
-            rotation_matrix[:3, :3],
-            big_vertices[pts * unit_verts_size : (pts + 1) * unit_verts_size].T,
-        ).T
+    if directions.size:
+        # Rotation matrices aligning the x axis with each direction, built
+        # for all the primitives at once (Rodrigues' rotation formula).
+        dir_abs = np.linalg.norm(directions, axis=1)
+        has_dir = dir_abs != 0
+        dirs = np.zeros(directions.shape, dtype=np.float64)
+        dirs[has_dir] = directions[has_dir] / dir_abs[has_dir, None]
+
+        v1, v2, v3 = np.cross(np.array([1.0, 0.0, 0.0]), dirs).T
+        c = dirs[:, 0]
+        zeros = np.zeros_like(c)
+        Vmat = np.array(
+            [[zeros, -v3, v2], [v3, zeros, -v1], [-v2, v1, zeros]]
+        ).transpose((2, 0, 1))
+
+        antipodal = c == -1.0
+        h = np.divide(1, 1 + c, out=np.zeros_like(c), where=~antipodal)
+        rotation_matrices = np.eye(3) + Vmat + np.matmul(Vmat, Vmat) * h[:, None, None]
+        rotation_matrices[antipodal] = -np.eye(3)
+        rotation_matrices[~has_dir] = np.eye(3)
+
+        big_vertices = np.matmul(
+            big_vertices.reshape((-1, unit_verts_size, 3)),
+            rotation_matrices.transpose((0, 2, 1)),
+        ).reshape((-1, 3))
 
     # apply centers position
     big_centers = np.repeat(centers, unit_verts_size, axis=0)
@@ -1,4 +1,4 @@
-from functools import partial
+from functools import lru_cache, partial
 import os
 
 import fury
@@ -103,6 +103,10 @@ def compose_shader(glsl_code):
 def import_fury_shader(shader_file):
     """Import a Fury shader.
 
+    The shaders in the fury/shaders directory are only read once. Call
+    ``import_fury_shader.cache_clear()`` to read them again after editing
+    them in a running session. Files outside this directory are always read.
+
     Parameters
     ----------
     shader_file : str
@@ -117,10 +121,22 @@ def import_fury_shader(shader_file):
         GLSL shader code.
 
     """
-    shader_fname = os.path.join(SHADERS_DIR, shader_file)
+    shader_fname = os.path.abspath(os.path.join(SHADERS_DIR, shader_file))
+    shaders_dir = os.path.abspath(SHADERS_DIR)
+    if not shader_fname.startswith(shaders_dir + os.sep):
+        return load_shader(shader_fname)
+    return _load_fury_shader(shader_fname)
+
+
+@lru_cache(maxsize=None)
+def _load_fury_shader(shader_fname):
+    """Load a shader from the fury/shaders directory only once."""
     return load_shader(shader_fname)
 
 
+import_fury_shader.cache_clear = _load_fury_shader.cache_clear
+
+
 def load_shader(shader_file):
     """Load a shader from a file.
 
@@ -324,7 +324,25 @@ def test_import_fury_shader():
     code = import_fury_shader(fname_test1)
     npt.assert_equal(code, str_test1)
 
+    # Test edited file after clearing the cache
+    with open(pname_test1, "w") as f:
+        f.write(str_test1 * 2)
+    import_fury_shader.cache_clear()
+    code = import_fury_shader(fname_test1)
+    npt.assert_equal(code, str_test1 * 2)
+
     os.remove(pname_test1)
+    import_fury_shader.cache_clear()
+
+    # Test edited file outside the shaders directory
+    with InTemporaryDirectory() as tdir:
+        pname_test3 = os.path.join(tdir, fname_test1)
+        with open(pname_test3, "w") as f:
+            f.write(str_test1)
+        npt.assert_equal(import_fury_shader(pname_test3), str_test1)
+        with open(pname_test3, "w") as f:
+            f.write(str_test1 * 2)
+        npt.assert_equal(import_fury_shader(pname_test3), str_test1 * 2)
 
 
 def test_load_shader():
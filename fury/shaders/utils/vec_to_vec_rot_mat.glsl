@@ -9,24 +9,25 @@ mat4 vec2VecRotMat(vec3 u, vec3 v)
     vec3 w = cross(u, v);
     float wn = length(w);
 
-    // Check that cross product is OK and vectors u, v are not collinear
-    // (norm(w)>0.0)
-    if(isnan(wn) || wn < 0.0)
-    {
-        float normUV = length(u - v);
-        // This is the case of two antipodal vectors:
-        // ** former checking assumed norm(u) == norm(v)
-        if(normUV > length(u))
-            return mat4(-1);
-        return mat4(1);
-    }
-
-    // if everything ok, normalize w
-    w = w / wn;
+    // u and v are collinear when the norm of w is close to 0. Both cases are
+    // blended at the end instead of branching.
+    float collinear = 1.0 - step(1e-6, wn);
+    // This is the case of two antipodal vectors:
+    // ** former checking assumed norm(u) == norm(v)
+    float antipodal = step(length(u), length(u - v));
+    // They are aligned by a half turn around any axis perpendicular to u,
+    // built from the coordinate axis that is the least aligned with u
+    vec3 ref = mix(vec3(1, 0, 0), vec3(0, 1, 0), step(0.9, abs(u.x)));
+    vec3 a = normalize(cross(u, ref));
+    mat3 halfTurn = 2.0 * outerProduct(a, a) - mat3(1);
+    mat3 collinearR = mat3(1) * (1.0 - antipodal) + halfTurn * antipodal;
+
+    // normalize w, avoiding a division by zero for collinear vectors
+    w = w / max(wn, 1e-6);
 
     // vp is in plane of u,v,  perpendicular to u
     vec3 vp = (v - dot(u, v) * u);
-    vp = vp / length(vp);
+    vp = vp / max(length(vp), 1e-6);
 
     // (u vp w) is an orthonormal basis
     mat3 Pt = mat3(u, vp, w);
@@ -38,11 +39,5 @@ mat4 vec2VecRotMat(vec3 u, vec3 v)
     mat3 R = mat3(mat2(cosa, sina, -sina, cosa));
     mat3 Rp = Pt * (R * P);
 
-    // make sure that you don't return any Nans
-    bool anyNanCheckRp0 = any(isnan(Rp[0]));
-    bool anyNanCheckRp1 = any(isnan(Rp[1]));
-    bool anyNanCheckRp2 = any(isnan(Rp[2]));
-    if(anyNanCheckRp0 || anyNanCheckRp1 || anyNanCheckRp2)
-        return mat4(1);
-    return mat4(Rp);
+    return mat4(Rp * (1.0 - collinear) + collinearR * collinear);
 }
@@ -19,7 +19,13 @@ from fury.testing import (
     assert_greater_equal,
     assert_not_equal,
 )
-from fury.utils import primitives_count_from_actor, rotate, shallow_copy
+from fury.utils import (
+    colors_from_actor,
+    primitives_count_from_actor,
+    rotate,
+    shallow_copy,
+    vertices_from_actor,
+)
 
 # dipy, have_dipy, _ = optional_package('dipy')
 matplotlib, have_matplotlib, _ = optional_package("matplotlib")
@@ -1187,6 +1193,60 @@ def test_advanced_geometry_actor(interactive=False):
         scene.clear()
 
 
+def test_cylinder_mixed_resolution(interactive=False):
+    xyz = np.array([[0, 0, 0], [50, 0, 0], [100, 0, 0]])
+    dirs = np.array([[0.5, 0.5, 0.5], [0.5, 0, 0.5], [0, 0.5, 0.5]])
+    heights = np.array([5, 7, 10])
+    colors = np.array([[1, 0, 0], [0, 1, 0], [1, 1, 0]])
+    resolutions = np.array([8, 16, 8])
+
+    cylinder_actor = actor.cylinder(
+        xyz, dirs, colors, heights=heights, resolution=resolutions
+    )
+    nb_verts = [
+        len(fp.prim_cylinder(sectors=int(r), capped=False)[0]) for r in resolutions
+    ]
+    vertices = vertices_from_actor(cylinder_actor)
+    npt.assert_equal(len(vertices), sum(nb_verts))
+
+    # The cylinders keep the order of the centers in the merged mesh.
+    offsets = np.cumsum([0] + nb_verts)
+    vertex_colors = colors_from_actor(cylinder_actor)
+    for i, (start, end) in enumerate(zip(offsets[:-1], offsets[1:])):
+        npt.assert_array_almost_equal(vertices[start:end].mean(axis=0), xyz[i], 1)
+        npt.assert_array_equal(
+            vertex_colors[start:end], [colors[i] * 255] * nb_verts[i]
+        )
+
+    scene = window.Scene()
+    scene.add(cylinder_actor)
+    if interactive:
+        window.show(scene)
+    arr = window.snapshot(scene)
+    report = window.analyze_snapshot(arr, colors=colors)
+    npt.assert_equal(report.objects, 3)
+
+    # A single resolution can be given as an array of size 1.
+    npt.assert_equal(
+        vertices_from_actor(actor.cylinder(xyz, dirs, colors, resolution=[8])).shape,
+        (3 * nb_verts[0], 3),
+    )
+
+    npt.assert_raises(ValueError, actor.cylinder, xyz, dirs, colors, resolution=[8, 16])
+    npt.assert_raises(
+        ValueError, actor.cylinder, xyz, dirs, colors, resolution=[8, 6, 8]
+    )
+    npt.assert_raises(
+        ValueError,
+        actor.cylinder,
+        xyz,
+        dirs,
+        colors,
+        resolution=resolutions,
+        repeat_primitive=False,
+    )
+
+
 def test_text_3d():
     msg = "I \nlove\n FURY"
 
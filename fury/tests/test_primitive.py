@@ -260,6 +260,27 @@ def test_repeat_primitive():
         npt.assert_equal(np.mean(big_vert_origin), 0)
 
 
+def test_repeat_primitive_directions():
+    verts = np.eye(3)
+    faces = np.array([[0, 1, 2]])
+    centers = np.zeros((5, 3))
+    dirs = np.array([[0, 2, 0], [1, 1, 1], [0, 0, 0], [-1, 0, 0], [1, 0, 0]])
+
+    res = fp.repeat_primitive(verts, faces, centers, directions=dirs)
+    big_verts = res[0].reshape((5, 3, 3))
+
+    unit_dirs = dirs[[0, 1, 3, 4]] / np.linalg.norm(dirs[[0, 1, 3, 4]], axis=1)[:, None]
+    # the x axis of each primitive is aligned with its direction
+    npt.assert_array_almost_equal(big_verts[[0, 1, 3, 4], 0], unit_dirs)
+    # and the primitives are only rotated
+    for rotated in big_verts:
+        npt.assert_array_almost_equal(np.dot(rotated, rotated.T), np.eye(3))
+    # a null direction leaves the primitive untouched
+    npt.assert_array_equal(big_verts[2], verts)
+    # an opposite direction flips the primitive
+    npt.assert_array_equal(big_verts[3], -verts)
+
+
 def test_repeat_primitive_function():
     # init variables
     centers = np.array([[0, 0, 0], [5, 0, 0], [10, 0, 0]])
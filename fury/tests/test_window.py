@@ -352,6 +352,55 @@ def test_save_screenshot():
         npt.assert_equal(data.shape[:2], desired_sz)
 
 
+def test_show_manager_record():
+    xyzr = np.array([[0, 0, 0, 10], [100, 0, 0, 25], [200, 0, 0, 50]])
+    colors = np.array([[1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1.0, 1]])
+    sphere_actor = actor.sphere(
+        centers=xyzr[:, :3], colors=colors[:], radii=xyzr[:, 3], phi=10, theta=30
+    )
+    scene = window.Scene()
+    scene.add(sphere_actor)
+
+    window_sz = (400, 400)
+    show_m = window.ShowManager(scene=scene, size=window_sz)
+
+    with InTemporaryDirectory():
+        fname = "test.png"
+        arr = show_m.record(out_path=fname)
+        npt.assert_equal(os.path.isfile(fname), True)
+        data = io.load_image(fname)
+        npt.assert_equal(data.shape[:2], window_sz[::-1])
+        npt.assert_array_equal(data, arr)
+        report = window.analyze_snapshot(data, colors=[(0, 255, 0), (255, 0, 0)])
+        npt.assert_equal(report.objects, 3)
+        npt.assert_equal(report.colors_found, (True, True))
+
+        # The window is reused and left in its previous state
+        npt.assert_equal(show_m.window.GetOffScreenRendering(), 0)
+        npt.assert_equal(show_m.window.HasRenderer(scene), 1)
+        sphere_actor.SetVisibility(False)
+        arr = show_m.record(out_path=fname)
+        npt.assert_equal(window.analyze_snapshot(arr).objects, 0)
+        sphere_actor.SetVisibility(True)
+
+        # The scene is shown and released by another manager in between
+        other_m = window.ShowManager(scene=scene, size=window_sz)
+        other_m.add_timer_callback(True, 10, lambda _obj, _event: other_m.exit())
+        other_m.start()
+        npt.assert_equal(scene.GetRenderWindow(), None)
+        arr = show_m.record(out_path=fname)
+        npt.assert_equal(scene.GetRenderWindow() is show_m.window, True)
+        npt.assert_equal(window.analyze_snapshot(arr).objects, 3)
+
+        # The window of the manager itself is finalized by start
+        show_m.add_timer_callback(True, 10, lambda _obj, _event: show_m.exit())
+        show_m.start()
+        npt.assert_equal(hasattr(show_m, "window"), False)
+        arr = show_m.record(out_path=fname)
+        npt.assert_equal(arr.shape[:2], window_sz[::-1])
+        npt.assert_equal(window.analyze_snapshot(arr).objects, 3)
+
+
 @pytest.mark.skipif(
     skip_win, reason="This test does not work on Windows." " Need to be introspected"
 )
@@ -4,6 +4,7 @@ __all__ = [
     "TabUI",
     "ImageContainer2D",
     "GridUI",
+    "UIBatch",
     "Rectangle2D",
     "Disk2D",
     "TextBlock2D",
@@ -39,7 +40,14 @@ from . import (
     elements as elements,
     helpers as helpers,
 )
-from .containers import GridUI, ImageContainer2D, Panel2D, TabPanel2D, TabUI
+from .containers import (
+    GridUI,
+    ImageContainer2D,
+    Panel2D,
+    TabPanel2D,
+    TabUI,
+    UIBatch,
+)
 from .core import UI, Button2D, Disk2D, Rectangle2D, TextBlock2D
 from .elements import (
     Card2D,
@@ -8,6 +8,7 @@ from fury.actor import grid
 from fury.decorators import warn_on_args_to_kwargs
 from fury.io import load_image
 from fury.lib import (
+    Actor2D,
     CellArray,
     FloatArray,
     Points,
@@ -16,9 +17,18 @@ from fury.lib import (
     Property2D,
     Texture,
     TexturedActor2D,
+    TriangleFilter,
+)
+from fury.ui.core import UI, Disk2D, Rectangle2D, TextBlock2D
+from fury.utils import (
+    get_polydata_triangles,
+    get_polydata_vertices,
+    rotate,
+    set_input,
+    set_polydata_colors,
+    set_polydata_triangles,
+    set_polydata_vertices,
 )
-from fury.ui.core import UI, Rectangle2D, TextBlock2D
-from fury.utils import rotate, set_input
 
 
 class Panel2D(UI):
@@ -1232,3 +1242,122 @@ class GridUI(UI):
         pass
         # self.actor.SetPosition(*coords)
         # self.container.SetPosition(*coords)
+
+
+class UIBatch(UI):
+    """Merge static 2D shapes into a single actor.
+
+    Every UI component owns its own actor, hence its own draw call. A
+    ``UIBatch`` gathers the geometry of several :class:`Rectangle2D` and
+    :class:`Disk2D` components into one polydata with per-vertex colors, so
+    that all of them are rendered with a single draw call.
+
+    The geometry, color and opacity of the elements are captured when the
+    batch is created; later changes to the elements are not reflected. The
+    batched elements should not be added to the scene themselves.
+
+    Attributes
+    ----------
+    elements : list of UI
+        The UI components merged into this batch.
+
+    """
+
+    @warn_on_args_to_kwargs()
+    def __init__(self, elements, *, position=None):
+        """Init class instance.
+
+        Parameters
+        ----------
+        elements : list of :class:`Rectangle2D` or :class:`Disk2D`
+            UI components to merge, from back to front.
+        position : (float, float), optional
+            Absolute coordinates (x, y) of the lower-left corner of the batch.
+            If None, the elements keep their current position on the screen.
+
+        """
+        self.elements = list(elements)
+        if not self.elements:
+            raise ValueError("UIBatch requires at least one element.")
+
+        for element in self.elements:
+            if not isinstance(element, (Rectangle2D, Disk2D)):
+                raise TypeError("Invalid element instance {}".format(type(element)))
+
+        super(UIBatch, self).__init__()
+        self.position = self._origin if position is None else position
+
+    def _setup(self):
+        """Set up this UI component.
+
+        Merge the triangulated geometry of all the elements into a single
+        polydata, expressed relative to their lower-left corner.
+
+        """
+        vertices = []
+        triangles = []
+        colors = []
+        offset = 0
+        for element in self.elements:
+            triangle_filter = TriangleFilter()
+            triangle_filter.SetInputData(element.actor.GetMapper().GetInput())
+            triangle_filter.Update()
+            polydata = triangle_filter.GetOutput()
+
+            element_vertices = np.array(get_polydata_vertices(polydata))
+            element_vertices[:, :2] += element.actor.GetPosition()
+            rgba = np.append(element.color, element.opacity)
+
+            vertices.append(element_vertices)
+            triangles.append(get_polydata_triangles(polydata) + offset)
+            colors.append(np.tile(255 * rgba, (len(element_vertices), 1)))
+            offset += len(element_vertices)
+
+        vertices = np.concatenate(vertices)
+        self._origin = vertices[:, :2].min(axis=0)
+        self._size = vertices[:, :2].max(axis=0) - self._origin
+        vertices[:, :2] -= self._origin
+
+        self._polydata = PolyData()
+        set_polydata_vertices(self._polydata, vertices)
+        set_polydata_triangles(self._polydata, np.concatenate(triangles))
+        set_polydata_colors(
+            self._polydata, np.round(np.concatenate(colors)).astype(np.uint8)
+        )
+
+        mapper = PolyDataMapper2D()
+        mapper = set_input(mapper, self._polydata)
+
+        self.actor = Actor2D()
+        self.actor.SetMapper(mapper)
+
+        # Add default events listener to the VTK actor.
+        self.handle_events(self.actor)
+
+    def _get_actors(self):
+        """Get the actors composing this UI component."""
+        return [self.actor]
+
+    def _add_to_scene(self, scene):
+        """Add all subcomponents or VTK props that compose this UI component.
+
+        Parameters
+        ----------
+        scene : scene
+
+        """
+        scene.add(self.actor)
+
+    def _get_size(self):
+        return self._size
+
+    def _set_position(self, coords):
+        """Set the lower-left corner position of this UI component.
+
+        Parameters
+        ----------
+        coords: (float, float)
+            Absolute pixel coordinates (x, y).
+
+        """
+        self.actor.SetPosition(*coords)
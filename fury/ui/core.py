@@ -1,6 +1,7 @@
 """UI core module that describe UI abstract class."""
 
 import abc
+from functools import lru_cache
 
 import numpy as np
 
@@ -20,8 +21,92 @@ from fury.lib import (
     TextActor,
     Texture,
     TexturedActor2D,
+    numpy_support,
 )
-from fury.utils import set_input
+from fury.utils import numpy_to_vtk_image_data, set_input
+
+
+@lru_cache(maxsize=64)
+def _load_icon(icon_fname):
+    """Load an icon as ImageData, decoding each file only once.
+
+    Icons are only read by the textures they are bound to, so the same
+    ImageData can safely be shared by several buttons.
+
+    Parameters
+    ----------
+    icon_fname : str
+        Path of the icon file.
+
+    Returns
+    -------
+    icon : ImageData
+
+    """
+    return load_image(icon_fname, as_vtktype=True)
+
+
+def _icon_to_rgba(icon):
+    """Convert icon ImageData to an RGBA array, bottom row first.
+
+    Parameters
+    ----------
+    icon : ImageData
+
+    Returns
+    -------
+    rgba : ndarray, shape (height, width, 4)
+
+    """
+    width, height, _ = icon.GetDimensions()
+    scalars = icon.GetPointData().GetScalars()
+    arr = numpy_support.vtk_to_numpy(scalars).reshape((height, width, -1))
+    opaque = np.iinfo(arr.dtype).max if arr.dtype.kind in "ui" else 1
+
+    rgba = np.full((height, width, 4), opaque, dtype=arr.dtype)
+    nb_colors = 1 if arr.shape[2] < 3 else 3
+    rgba[..., :3] = arr[..., :nb_colors]
+    if arr.shape[2] in (2, 4):
+        rgba[..., 3] = arr[..., -1]
+    return rgba
+
+
+@lru_cache(maxsize=64)
+def _load_icon_atlas(icon_fnames):
+    """Stack icons into a single ImageData, one above the other.
+
+    Switching between icons of the atlas only requires new texture
+    coordinates, so the texture is uploaded once per button.
+
+    Parameters
+    ----------
+    icon_fnames : tuple of str
+        Paths of the icon files.
+
+    Returns
+    -------
+    atlas : ImageData
+    tcoords : tuple of (float, float, float, float)
+        Texture coordinates (u_min, v_min, u_max, v_max) of each icon in
+        the atlas.
+
+    """
+    icons = [_icon_to_rgba(_load_icon(icon_fname)) for icon_fname in icon_fnames]
+    width = max(icon.shape[1] for icon in icons)
+    height = sum(icon.shape[0] for icon in icons)
+    dtype = np.result_type(*icons)
+
+    atlas = np.zeros((height, width, 4), dtype=dtype)
+    tcoords = []
+    v_min = 0
+    for icon in icons:
+        v_max = v_min + icon.shape[0]
+        atlas[v_min:v_max, : icon.shape[1]] = icon
+        tcoords.append((0.0, v_min / height, icon.shape[1] / width, v_max / height))
+        v_min = v_max
+
+    # numpy_to_vtk_image_data expects the top row first.
+    return numpy_to_vtk_image_data(np.flipud(atlas)), tuple(tcoords)
 
 
 class UI(object, metaclass=abc.ABCMeta):
@@ -1259,9 +1344,12 @@ class Button2D(UI):
         self.icon_extents = {}
         self.icons = self._build_icons(icon_fnames)
         self.icon_names = [icon[0] for icon in self.icons]
+        self._icon_atlas, self._icon_tcoords = _load_icon_atlas(
+            tuple(icon_fname for _, icon_fname in icon_fnames)
+        )
         self.current_icon_id = 0
         self.current_icon_name = self.icon_names[self.current_icon_id]
-        self.set_icon(self.icons[self.current_icon_id][1])
+        self._show_icon(self.current_icon_id)
         self.resize(size)
 
     def _get_size(self):
@@ -1289,7 +1377,7 @@ class Button2D(UI):
         """
         icons = []
         for icon_name, icon_fname in icon_fnames:
-            icons.append((icon_name, load_image(icon_fname, as_vtktype=True)))
+            icons.append((icon_name, _load_icon(icon_fname)))
 
         return icons
 
@@ -1314,18 +1402,11 @@ class Button2D(UI):
         polys.InsertCellPoint(3)
         self.texture_polydata.SetPolys(polys)
 
-        tc = FloatArray()
-        tc.SetNumberOfComponents(2)
-        tc.SetNumberOfTuples(4)
-        tc.InsertComponent(0, 0, 0.0)
-        tc.InsertComponent(0, 1, 0.0)
-        tc.InsertComponent(1, 0, 1.0)
-        tc.InsertComponent(1, 1, 0.0)
-        tc.InsertComponent(2, 0, 1.0)
-        tc.InsertComponent(2, 1, 1.0)
-        tc.InsertComponent(3, 0, 0.0)
-        tc.InsertComponent(3, 1, 1.0)
-        self.texture_polydata.GetPointData().SetTCoords(tc)
+        self.texture_tcoords = FloatArray()
+        self.texture_tcoords.SetNumberOfComponents(2)
+        self.texture_tcoords.SetNumberOfTuples(4)
+        self._set_tcoords((0.0, 0.0, 1.0, 1.0))
+        self.texture_polydata.GetPointData().SetTCoords(self.texture_tcoords)
 
         texture_mapper = PolyDataMapper2D()
         texture_mapper = set_input(texture_mapper, self.texture_polydata)
@@ -1423,7 +1504,7 @@ class Button2D(UI):
 
         """
         icon_id = self.icon_names.index(icon_name)
-        self.set_icon(self.icons[icon_id][1])
+        self._show_icon(icon_id)
 
     def set_icon(self, icon):
         """Modify the icon used by the vtkTexturedActor2D.
@@ -1434,6 +1515,36 @@ class Button2D(UI):
 
         """
         self.texture = set_input(self.texture, icon)
+        self._set_tcoords((0.0, 0.0, 1.0, 1.0))
+
+    def _show_icon(self, icon_id):
+        """Show one of the button's icons from its icon atlas.
+
+        Parameters
+        ----------
+        icon_id : int
+            Index of the icon in ``icons``.
+
+        """
+        if self.texture.GetInput() is not self._icon_atlas:
+            self.texture = set_input(self.texture, self._icon_atlas)
+        self._set_tcoords(self._icon_tcoords[icon_id])
+
+    def _set_tcoords(self, tcoords):
+        """Set the texture coordinates of the button's corners.
+
+        Parameters
+        ----------
+        tcoords : (float, float, float, float)
+            Texture coordinates (u_min, v_min, u_max, v_max) of the icon.
+
+        """
+        u_min, v_min, u_max, v_max = tcoords
+        self.texture_tcoords.SetTuple2(0, u_min, v_min)
+        self.texture_tcoords.SetTuple2(1, u_max, v_min)
+        self.texture_tcoords.SetTuple2(2, u_max, v_max)
+        self.texture_tcoords.SetTuple2(3, u_min, v_max)
+        self.texture_tcoords.Modified()
 
     def next_icon_id(self):
         """Set the next icon ID while cycling through icons."""
@@ -1448,4 +1559,4 @@ class Button2D(UI):
         Also changes the icon.
         """
         self.next_icon_id()
-        self.set_icon(self.icons[self.current_icon_id][1])
+        self._show_icon(self.current_icon_id)
@@ -2838,12 +2838,14 @@ class ListBox2D(UI):
         view_end = view_start + self.nb_slots
         values_to_show = self.values[view_start:view_end]
 
-        # Populate slots according to the view.
+        # Populate slots according to the view. Only slots showing a new value
+        # are relabeled, selecting an item only changes the slot colors.
         for i, choice in enumerate(values_to_show):
             slot = self.slots[i]
-            slot.element = choice
-            if slot.textblock.scene is not None:
-                clip_overflow(slot.textblock, self.slot_width)
+            if slot.element is not choice:
+                slot.element = choice
+                if slot.textblock.scene is not None:
+                    clip_overflow(slot.textblock, self.slot_width)
             slot.set_visibility(True)
             if slot.size[1] != self.slot_height:
                 slot.resize((self.slot_width, self.slot_height))
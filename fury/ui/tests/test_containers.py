@@ -280,6 +280,52 @@ def test_ui_image_container_2d(interactive=False):
         show_manager.start()
 
 
+def test_ui_batch(interactive=False):
+    rect = ui.Rectangle2D(size=(100, 50), position=(50, 50), color=(1, 0, 1))
+    disk = ui.Disk2D(outer_radius=40, center=(250, 250), color=(1, 1, 0))
+    ring = ui.Disk2D(
+        outer_radius=40, inner_radius=30, center=(150, 250), color=(0, 1, 1)
+    )
+
+    batch = ui.UIBatch([rect, disk, ring])
+    npt.assert_equal(len(batch.actors), 1)
+    npt.assert_array_equal(batch.position, (50, 50))
+    npt.assert_allclose(batch.size, (240, 240), atol=1)
+
+    polydata = batch.actor.GetMapper().GetInput()
+    nb_points = sum(
+        element.actor.GetMapper().GetInput().GetNumberOfPoints()
+        for element in (rect, disk, ring)
+    )
+    npt.assert_equal(polydata.GetNumberOfPoints(), nb_points)
+
+    colors = polydata.GetPointData().GetScalars()
+    npt.assert_equal(colors.GetNumberOfComponents(), 4)
+    npt.assert_array_equal(colors.GetTuple(0), (255, 0, 255, 255))
+
+    # The batch renders the same image as the individual elements.
+    current_size = (300, 300)
+    show_manager = window.ShowManager(size=current_size)
+    show_manager.scene.add(rect, disk, ring)
+    expected = window.snapshot(show_manager.scene, size=current_size)
+
+    show_manager = window.ShowManager(size=current_size, title="FURY UIBatch")
+    show_manager.scene.add(batch)
+    arr = window.snapshot(show_manager.scene, size=current_size)
+    npt.assert_array_equal(arr, expected)
+    report = window.analyze_snapshot(arr)
+    npt.assert_equal(report.objects, 3)
+
+    if interactive:
+        show_manager.start()
+
+    batch.position = (0, 0)
+    npt.assert_array_equal(batch.actor.GetPosition(), (0, 0))
+
+    npt.assert_raises(TypeError, ui.UIBatch, [ui.TextBlock2D()])
+    npt.assert_raises(ValueError, ui.UIBatch, [])
+
+
 def test_ui_tab_ui(interactive=False):
     filename = "test_ui_tab_ui"
     recording_filename = pjoin(DATA_DIR, filename + ".log.gz")
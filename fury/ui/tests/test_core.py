@@ -1,12 +1,14 @@
 """Core module testing."""
 
 from os.path import join as pjoin
+from tempfile import TemporaryDirectory as InTemporaryDirectory
 
 import numpy as np
 import numpy.testing as npt
 
 from fury import ui, window
 from fury.data import DATA_DIR, fetch_viz_icons, read_viz_icons
+from fury.io import save_image
 from fury.testing import EventCounter
 
 
@@ -146,6 +148,71 @@ def test_ui_button_panel(recording=False):
         event_counter.check_counts(expected)
 
 
+def test_ui_button_icons_are_shared():
+    fetch_viz_icons()
+
+    stop_fname = read_viz_icons(fname="stop2.png")
+    play_fname = read_viz_icons(fname="play3.png")
+
+    button_1 = ui.Button2D(icon_fnames=[("stop", stop_fname), ("play", play_fname)])
+    button_2 = ui.Button2D(icon_fnames=[("play", play_fname)])
+
+    # The same file is decoded once and shared by both buttons.
+    npt.assert_equal(button_1.icons[1][1] is button_2.icons[0][1], True)
+    npt.assert_equal(button_1.icons[0][1] is button_1.icons[1][1], False)
+
+
+def test_ui_button_icon_atlas():
+    red_icon = np.zeros((8, 8, 3), dtype=np.uint8)
+    red_icon[..., 0] = 255
+    blue_icon = np.zeros((4, 6, 4), dtype=np.uint8)
+    blue_icon[..., 2:] = 255
+
+    with InTemporaryDirectory() as tmpdir:
+        icon_files = [
+            ("red", pjoin(tmpdir, "red.png")),
+            ("blue", pjoin(tmpdir, "blue.png")),
+        ]
+        save_image(red_icon, icon_files[0][1])
+        save_image(blue_icon, icon_files[1][1])
+        button = ui.Button2D(icon_fnames=icon_files, size=(50, 50))
+        other_button = ui.Button2D(icon_fnames=icon_files)
+
+    # Buttons with the same icons share their atlas.
+    npt.assert_equal(button._icon_atlas is other_button._icon_atlas, True)
+    npt.assert_equal(button._icon_atlas.GetDimensions(), (8, 12, 1))
+
+    show_manager = window.ShowManager(size=(50, 50))
+    show_manager.scene.add(button)
+
+    def assert_icon_color(color):
+        arr = window.snapshot(show_manager.scene, render_window=show_manager.window)
+        npt.assert_array_equal(np.unique(arr.reshape(-1, 3), axis=0), [color])
+
+    texture_input = button.texture.GetInput()
+    show_manager.render()
+    assert_icon_color([255, 0, 0])
+
+    button.next_icon()
+    show_manager.render()
+    assert_icon_color([0, 0, 255])
+    npt.assert_equal(button.current_icon_name, "blue")
+    # Switching icons does not change the texture input.
+    npt.assert_equal(button.texture.GetInput() is texture_input, True)
+
+    button.set_icon_by_name("red")
+    show_manager.render()
+    assert_icon_color([255, 0, 0])
+
+    # Any ImageData can still be used as icon.
+    button.set_icon(button.icons[1][1])
+    show_manager.render()
+    assert_icon_color([0, 0, 255])
+    button.next_icon()
+    show_manager.render()
+    assert_icon_color([255, 0, 0])
+
+
 def test_ui_rectangle_2d():
     window_size = (700, 700)
     show_manager = window.ShowManager(size=window_size)
@@ -961,6 +961,29 @@ def test_ui_listbox_2d_visibility():
     assert_listbox(l2, 0)
 
 
+def test_ui_listbox_2d_update_changed_slots():
+    values = ["A very long value that overflows", "Indigo", "Blue", "Yellow"]
+    listbox = ui.ListBox2D(values=values, size=(150, 100))
+    show_manager = window.ShowManager()
+    show_manager.scene.add(listbox)
+
+    first_slot = listbox.slots[0]
+    assert first_slot.textblock.message.endswith("...")
+    mtime = first_slot.textblock.actor.GetMTime()
+
+    # Selecting an item does not relabel the slots.
+    listbox.select(listbox.slots[1])
+    npt.assert_equal(first_slot.textblock.actor.GetMTime(), mtime)
+    npt.assert_equal(listbox.slots[1].selected, True)
+    npt.assert_equal(first_slot.selected, False)
+
+    # Scrolling relabels the slots showing new values.
+    listbox.view_offset = 1
+    listbox.update()
+    npt.assert_equal(first_slot.element, "Indigo")
+    npt.assert_equal(first_slot.textblock.message, "Indigo")
+
+
 def test_ui_file_menu_2d(interactive=False):
     filename = "test_ui_file_menu_2d"
     recording_filename = pjoin(DATA_DIR, filename + ".log.gz")
@@ -836,6 +836,57 @@ class ShowManager:
             stereo=stereo,
         )
 
+    @warn_on_args_to_kwargs()
+    def record(self, *, out_path="fury.png", dpi=(72, 72)):
+        """Render the scene offscreen in the current window and save it.
+
+        Unlike :func:`record`, no new render window is created, so the
+        actors already uploaded to this window's OpenGL context are reused.
+        If the window was closed by :meth:`start`, a new one is created, and
+        if the scene was shown in another window meanwhile, it is attached
+        back to this one.
+
+        Parameters
+        ----------
+        out_path : str, optional
+            File name where to save the image. Default is "fury.png".
+        dpi : float or (float, float), optional
+            Dots per inch (dpi) for saved image.
+            Single values are applied as dpi for both dimensions.
+
+        Returns
+        -------
+        arr : ndarray
+            Color array of size (height, width, 3) where the last dimension
+            holds the RGB values.
+
+        """
+        if not hasattr(self, "window"):
+            self.__init__(
+                self.scene,
+                self.title,
+                size=self.size,
+                png_magnify=self.png_magnify,
+                reset_camera=self.reset_camera,
+                order_transparent=self.order_transparent,
+                interactor_style=self.interactor_style,
+            )
+        if not self.window.HasRenderer(self.scene):
+            self.window.AddRenderer(self.scene)
+        if self.scene.GetRenderWindow() is not self.window:
+            self.scene.SetRenderWindow(self.window)
+
+        offscreen = self.window.GetOffScreenRendering()
+        self.window.SetOffScreenRendering(1)
+        try:
+            self.render()
+            arr = snapshot(
+                self.scene, fname=out_path, dpi=dpi, render_window=self.window
+            )
+        finally:
+            self.window.SetOffScreenRendering(offscreen)
+        return arr
+
 
 @warn_on_args_to_kwargs()
 def show(
@@ -1184,7 +1235,8 @@ def snapshot(
         Dots per inch (dpi) for saved image.
         Single values are applied as dpi for both dimensions.
     render_window : RenderWindow
-        If provided, use this window instead of creating a new one.
+        If provided, use this window instead of creating a new one. The
+        window is expected to be rendered already and is left open.
 
     Returns
     -------
@@ -1194,7 +1246,8 @@ def snapshot(
 
     """
     width, height = size
-    if render_window is None:
+    own_window = render_window is None
+    if own_window:
         render_window = RenderWindow()
         if offscreen:
             render_window.SetOffScreenRendering(1)
@@ -1229,8 +1282,9 @@ def snapshot(
 
     save_image(arr, fname, dpi=dpi)
 
-    render_window.RemoveRenderer(scene)
-    render_window.Finalize()
+    if own_window:
+        render_window.RemoveRenderer(scene)
+        render_window.Finalize()
 
     return arr
 